@@ -1,30 +1,39 @@
 import os
-from pydantic_settings import BaseSettings, SettingsConfigDict
+import functools
+from dataclasses import dataclass
+from typing import Optional
 
 __all__ = [
     'PostgresDBConfig',
     'pg_config'
 ]
 
+_PG_CONN_STR_TEMPLATE = \
+    "postgresql://postgres:{pg_password}@{pg_host}:{pg_port}/pfun"
 
-class PostgresDBConfig(BaseSettings):
+
+@dataclass(frozen=True, slots=True)
+class PostgresDBConfig:
     """Postgres database configuration for pfun_data operations."""
-    model_config = SettingsConfigDict(
-        env_file='.env', validate_default=True, extra='allow')
-    _pg_conn_str_template: str = \
-        "postgresql://postgres:{pg_password}@{pg_host}:{pg_port}/pfun"
-    pg_host: str = os.getenv("POSTGRES_HOST")
-    pg_port: int = os.getenv("POSTGRES_PORT")
-    pg_password: str = os.getenv("POSTGRES_PASSWORD")
+    pg_host: Optional[str]
+    pg_port: int
+    pg_password: Optional[str]
 
     @property
     def pg_conn_str(self) -> str:
         """Postgres connection string."""
-        return self._pg_conn_str_template.format(
+        return _PG_CONN_STR_TEMPLATE.format(
             pg_password=self.pg_password,
             pg_host=self.pg_host,
             pg_port=self.pg_port
         )
 
 
-pg_config = PostgresDBConfig()
+@functools.cache
+def pg_config() -> PostgresDBConfig:
+    """Postgres database configuration, read from the environment on first use."""
+    return PostgresDBConfig(
+        pg_host=os.getenv("POSTGRES_HOST"),
+        pg_port=int(os.getenv("POSTGRES_PORT", "5432")),
+        pg_password=os.getenv("POSTGRES_PASSWORD"),
+    )
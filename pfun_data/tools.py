@@ -1,82 +1,374 @@
+import os
 import sys
 import json
+import shutil
+import struct
+import re
+import mmap
+import math
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.dataset as pads
+import pyarrow.parquet as pq
 import zipfile
+import zlib
+import heapq
+import itertools
+import importlib
+import importlib.util
+import contextlib
+import functools
+import threading
 import concurrent.futures
 from pathlib import Path
 import argparse
-from typing import Optional
+from typing import AbstractSet, Iterator, Literal, Mapping, Optional
 import logging
 import logging.config
-import datetime
-
-# Setup log file path using UTC date
-log_dir = Path("logs")
-log_dir.mkdir(exist_ok=True)
-tstamp = datetime.datetime.now(
-    datetime.timezone.utc
-).strftime('%Y-%m-%d-%H_%M')
-log_filename = log_dir / f"{tstamp}.log"
-
-logging.config.dictConfig(
-    {
-        "version": 1,
-        "formatters": {
-            "standard": {"format": "%(asctime)s [%(levelname)s] %(name)s: %(message)s"}
-        },
-        "handlers": {
-            "default": {
-                "level": "INFO",
-                "class": "logging.StreamHandler",
-                "formatter": "standard",
-            },
-            "file": {
-                "level": "INFO",
-                "class": "logging.FileHandler",
-                "formatter": "standard",
-                "filename": str(log_filename),
-                "mode": "a",
-                "encoding": "utf-8",
-            }
-        },
-        "loggers": {
-            "": {
-                "handlers": ["default", "file"],
-                "level": "INFO",
-                "propagate": True
-            }
-        },
-    }
-)
-
-
-def _extract_single_zipitem(zip_path, info_item, output_path, skip_existing: bool = True):
+import logging.handlers
+import time
+
+#: Block size used by the streaming pyarrow CSV reader (32 MiB). Each block
+#: becomes one record batch, which bounds peak memory per file.
+_CSV_BLOCK_SIZE = 32 << 20
+
+#: Target number of rows per Parquet row group.
+_PARQUET_ROW_GROUP_SIZE = 1_000_000
+
+#: Parquet writer options: dictionary (+RLE) encoding, zstd level 3 and 1 MiB data pages.
+_PARQUET_WRITE_OPTIONS = {
+    "compression": "zstd",
+    "compression_level": 3,
+    "use_dictionary": True,
+    "data_page_size": 1 << 20,
+}
+
+#: Rows sampled from each string column when deciding whether to dictionary-encode it.
+_DICTIONARY_SAMPLE_SIZE = 1024
+
+#: String columns whose sampled distinct-value ratio exceeds this (GUIDs, hashes, ...)
+#: are written PLAIN rather than building a dictionary that would be discarded anyway.
+_DICTIONARY_MAX_UNIQUE_RATIO = 0.8
+
+#: CSV files larger than this (1 GiB) are split into byte ranges converted in parallel.
+_LARGE_CSV_SIZE = 1 << 30
+
+#: Size of each byte range ("part") a large CSV file is split into (256 MiB).
+_CSV_PART_SIZE = 256 << 20
+
+#: Byte range read per chunk by the cuDF engine (256 MiB).
+_CUDF_CHUNK_SIZE = 256 << 20
+
+#: Arrow compute threads available to each concurrently converted CSV file.
+_ARROW_THREADS_PER_FILE = 4
+
+#: Buffer size used when streaming zip members to disk (1 MiB).
+_COPY_BUFSIZE = 1 << 20
+
+#: Whether stored (uncompressed) zip members can be copied with os.sendfile, which
+#: on Linux accepts a regular file as the destination.
+_HAS_SENDFILE = sys.platform == "linux" and hasattr(os, "sendfile")
+
+#: zlib-compatible modules that can be used to inflate deflated zip members.
+#: ``isal`` (python-isal) and ``zlib-ng`` are optional SIMD-accelerated drop-ins.
+_ZLIB_BACKENDS = {
+    "zlib": "zlib",
+    "isal": "isal.isal_zlib",
+    "zlib-ng": "zlib_ng.zlib_ng",
+}
+
+ZlibBackend = Literal["zlib", "isal", "zlib-ng"]
+
+
+def _load_zlib_backend(backend: ZlibBackend):
+    """Import the zlib-compatible module for `backend`, falling back to the stdlib zlib."""
+    if backend not in _ZLIB_BACKENDS:
+        raise ValueError(
+            f"Unknown decompression backend '{backend}' (expected one of {list(_ZLIB_BACKENDS)})")
+    try:
+        return importlib.import_module(_ZLIB_BACKENDS[backend])
+    except ImportError:
+        logging.info("Decompression backend '%s' is not installed, using 'zlib'.", backend)
+        return zlib
+
+
+class _SharedPatch:
+    """A process-wide setting applied while at least one caller is inside `applied`.
+
+    Overlapping callers (e.g. conversions running on separate threads) share
+    one application of the setting: the first caller in applies it, and the
+    last one out restores what was there before.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._users = 0
+        self._restore = None
+
+    @contextlib.contextmanager
+    def applied(self, apply):
+        """Hold the setting installed by ``apply()``, which returns a callable undoing it."""
+        with self._lock:
+            if self._users == 0:
+                self._restore = apply()
+            self._users += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._users -= 1
+                if self._users == 0:
+                    self._restore()
+                    self._restore = None
+
+
+#: zipfile's module-level decompressor/CRC32 hooks, swapped by `_zip_decompression_backend`.
+_zipfile_patch = _SharedPatch()
+
+
+@contextlib.contextmanager
+def _zip_decompression_backend(backend: ZlibBackend):
+    """Route zipfile's deflate decompression and CRC32 through `backend` for the duration of the block.
+
+    zipfile is patched process-wide, so when calls overlap the backend of the
+    first one in is used by all of them (every backend inflates identically).
+    """
+    zlib_module = _load_zlib_backend(backend)
+    if zlib_module is zlib:
+        yield
+        return
+
+    def apply():
+        get_decompressor, crc32 = zipfile._get_decompressor, zipfile.crc32
+
+        def _get_decompressor(compress_type):
+            if compress_type == zipfile.ZIP_DEFLATED:
+                return zlib_module.decompressobj(-15)
+            return get_decompressor(compress_type)
+
+        def restore():
+            zipfile._get_decompressor, zipfile.crc32 = get_decompressor, crc32
+
+        zipfile._get_decompressor, zipfile.crc32 = _get_decompressor, zlib_module.crc32
+        return restore
+
+    with _zipfile_patch.applied(apply):
+        yield
+
+
+def _iter_files(path: Path | str) -> Iterator[tuple[str, os.DirEntry]]:
+    """Yield ``(relative posix path, DirEntry)`` for every file under `path`, using one scandir per directory."""
+    stack = [("", os.fspath(path))]
+    while stack:
+        prefix, directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append((f"{prefix}{entry.name}/", entry.path))
+                    elif entry.is_file():
+                        yield f"{prefix}{entry.name}", entry
+        except FileNotFoundError:
+            continue
+
+
+def _existing_file_sizes(path: Path | str) -> dict[str, int]:
+    """Inventory of the files already under `path`, as ``{relative posix path: size}``."""
+    return {relpath: entry.stat().st_size for relpath, entry in _iter_files(path)}
+
+
+def _existing_files(path: Path | str) -> frozenset[str]:
+    """Relative posix paths of the files already under `path`."""
+    return frozenset(relpath for relpath, _ in _iter_files(path))
+
+
+def _member_output_path(output_path, info_item: zipfile.ZipInfo) -> Path:
+    """Resolve where a zip member should be written, refusing paths that escape `output_path`."""
+    member = Path(info_item.filename)
+    if member.is_absolute() or ".." in member.parts:
+        raise ValueError(f"Refusing to extract unsafe zip member '{info_item.filename}'")
+    return Path(output_path).joinpath(member)
+
+
+def _sendfile_stored_zipitem(zipref: zipfile.ZipFile, info_item: zipfile.ZipInfo, dst) -> None:
+    """Copy a stored (uncompressed) member into `dst` with os.sendfile, without user-space copies.
+
+    Unlike ``ZipFile.open`` this does not verify the member's CRC.
+    """
+    src_fd = zipref.fp.fileno()
+    # the data starts after the local file header, whose name/extra lengths
+    # can differ from those recorded in the central directory.
+    fheader = struct.unpack(
+        zipfile.structFileHeader, os.pread(src_fd, zipfile.sizeFileHeader, info_item.header_offset))
+    if fheader[zipfile._FH_SIGNATURE] != zipfile.stringFileHeader:
+        raise zipfile.BadZipFile(f"Bad magic number for file header of '{info_item.filename}'")
+    offset = (info_item.header_offset + zipfile.sizeFileHeader
+              + fheader[zipfile._FH_FILENAME_LENGTH] + fheader[zipfile._FH_EXTRA_FIELD_LENGTH])
+    remaining = info_item.file_size
+    while remaining:
+        sent = os.sendfile(dst.fileno(), src_fd, offset, remaining)
+        if sent == 0:
+            raise EOFError(f"Unexpected end of archive while extracting '{info_item.filename}'")
+        offset += sent
+        remaining -= sent
+
+
+def _extract_single_zipitem(
+    zipref: zipfile.ZipFile, info_item: zipfile.ZipInfo, output_path,
+    existing: Mapping[str, int]
+):
+    if info_item.is_dir():
+        # directories are created up front by `_make_member_dirs`.
+        return True
+    full_output_filepath = _member_output_path(output_path, info_item)
+    # skip if the file was already extracted with the expected uncompressed size.
+    if existing.get(info_item.filename) == info_item.file_size:
+        logging.info("* Skipping existing file '%s' !", full_output_filepath)
+        return True
+    logging.info("Extracting '%s'...", info_item.filename)
+    with open(full_output_filepath, "wb") as dst:
+        if (_HAS_SENDFILE
+                and info_item.compress_type == zipfile.ZIP_STORED
+                and not info_item.flag_bits & 0x1):  # not encrypted
+            _sendfile_stored_zipitem(zipref, info_item, dst)
+        else:
+            with zipref.open(info_item) as src:
+                shutil.copyfileobj(src, dst, length=_COPY_BUFSIZE)
+
+
+def _make_member_dirs(output_path, infolist: list[zipfile.ZipInfo]) -> None:
+    """Create every directory the zip members extract into, once each, shallowest first."""
+    member_dirs = set()
+    for info_item in infolist:
+        try:
+            member_path = _member_output_path(output_path, info_item)
+        except ValueError:
+            continue  # reported when the member itself is extracted
+        member_dirs.add(member_path if info_item.is_dir() else member_path.parent)
+    for member_dir in sorted(member_dirs, key=lambda p: len(p.parts)):
+        member_dir.mkdir(parents=True, exist_ok=True)
+
+
+@contextlib.contextmanager
+def _cancelling_on_interrupt(executor: concurrent.futures.Executor):
+    """Cancel `executor`'s queued tasks if the block is interrupted (Ctrl-C).
+
+    Only the main thread sees ``KeyboardInterrupt``, and leaving the executor's
+    ``with`` block would otherwise run the whole remaining queue before it is
+    re-raised. Tasks already running are left to finish; the yielded event is
+    set on interrupt, for long-running tasks to stop early.
+    """
+    interrupted = threading.Event()
     try:
-        full_output_filepath = Path(output_path).joinpath(info_item.filename)
-        # skip if flag is True AND file exists AND filesize is the same as expected uncompressed.
-        if all([full_output_filepath.exists(),
-                skip_existing is True,
-                full_output_filepath.stat().st_size == info_item.file_size]):
-            logging.info("* Skipping existing file '%s' !", full_output_filepath)
-            return True
-        logging.info("Extracting '%s'...", info_item.filename)
-        with zipfile.ZipFile(zip_path, "r") as zipref:
-            zipref.extract(info_item, path=output_path)
+        yield interrupted
     except KeyboardInterrupt:
-        logging.warning("Extraction interrupted by user.")
-        sys.exit(0)
+        interrupted.set()
+        logging.warning("Interrupted by user, cancelling queued tasks...")
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+
+
+#: Per-worker-thread state, set up by `_init_zip_worker`.
+_zip_worker = threading.local()
+
+#: Guards the lists of handles opened by `_init_zip_worker`.
+_zip_worker_lock = threading.Lock()
+
 
+def _init_zip_worker(zip_path: Path | str, handles: list[zipfile.ZipFile]):
+    """Executor initializer: open a ZipFile handle private to the calling worker thread.
 
-def extractFromZip(zip_path: Path | str, output_path: Path | str, skip_existing: bool = True):
-    """Extract all files from a zipfile."""
-    infolist = []
+    Reads through a shared ZipFile are serialized behind its file lock (the
+    disk read included), so each worker gets its own handle, opened once per
+    worker rather than once per task. The handle is also added to `handles`,
+    for the pool's owner to close.
+    """
+    _zip_worker.zipref = zipfile.ZipFile(zip_path, "r")
+    with _zip_worker_lock:
+        handles.append(_zip_worker.zipref)
+
+
+@contextlib.contextmanager
+def _zip_worker_pool(zip_path: Path | str, max_workers: int):
+    """Thread pool whose workers each read `zip_path` through their own handle (see ``_init_zip_worker``).
+
+    The handles are closed once the pool has shut down.
+    """
+    handles = []
+    try:
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, initializer=_init_zip_worker, initargs=(zip_path, handles)
+        ) as executor:
+            yield executor
+    finally:
+        with _zip_worker_lock:
+            for zipref in handles:
+                zipref.close()
+
+
+def _shard_zipitems(infolist: list[zipfile.ZipInfo], n_shards: int) -> list[list[zipfile.ZipInfo]]:
+    """Greedily pack zip members into `n_shards` groups of roughly equal uncompressed size.
+
+    Shards are returned largest first, each listing its own members largest
+    first, so that submitting them in order schedules the longest work first.
+    """
+    shards = [[] for _ in range(max(1, min(n_shards, len(infolist))))]
+    totals = [0] * len(shards)
+    heap = [(0, i) for i in range(len(shards))]
+    for info_item in sorted(infolist, key=lambda z: z.file_size, reverse=True):
+        total, i = heapq.heappop(heap)
+        shards[i].append(info_item)
+        totals[i] = total + info_item.file_size
+        heapq.heappush(heap, (totals[i], i))
+    return [shard for _, shard in sorted(zip(totals, shards), key=lambda x: x[0], reverse=True)]
+
+
+def _extract_shard(
+    shard: list[zipfile.ZipInfo], output_path, existing: Mapping[str, int],
+    interrupted: threading.Event
+):
+    """Extract a batch of zip members, logging (rather than raising) per-member failures."""
+    for info_item in shard:
+        if interrupted.is_set():
+            return
+        try:
+            _extract_single_zipitem(_zip_worker.zipref, info_item, output_path, existing)
+        except Exception as exc:
+            logging.error("Error extracting '%s' from zipfile: %s", info_item.filename, exc)
+
+
+def extractFromZip(
+    zip_path: Path | str, output_path: Path | str, skip_existing: bool = True,
+    backend: ZlibBackend = "isal"
+):
+    """Extract all files from a zipfile.
+
+    Decompression releases the GIL, so a thread pool is used, with one
+    ``ZipFile`` handle per worker thread (see ``_init_zip_worker``).
+    Members are batched into size-balanced shards, one task per shard, so
+    archives of many tiny files are not dominated by per-task overhead.
+
+    Arguments:
+    ----------
+
+    backend : zlib implementation used to inflate deflated members. ``"isal"``
+        and ``"zlib-ng"`` are used when installed, otherwise stdlib ``zlib``.
+
+    """
+    # one directory scan up front, rather than exists() + stat() per member.
+    existing = _existing_file_sizes(output_path) if skip_existing else {}
     with zipfile.ZipFile(zip_path, "r") as zipref:
-        infolist = [zitem for zitem in zipref.infolist()]
-    with concurrent.futures.ProcessPoolExecutor(max_workers=4) as executor:
+        infolist = zipref.infolist()
+    # create the directory tree once, rather than checking it per extracted member.
+    _make_member_dirs(output_path, infolist)
+    max_workers = os.cpu_count() or 1
+    with _zip_decompression_backend(backend), _zip_worker_pool(zip_path, max_workers) as executor, \
+            _cancelling_on_interrupt(executor) as interrupted:
         futures = [
-            executor.submit(_extract_single_zipitem, zip_path,
-                            info_item, output_path, skip_existing)
-            for info_item in infolist
+            executor.submit(_extract_shard, shard, output_path, existing, interrupted)
+            for shard in _shard_zipitems(infolist, 4 * max_workers)
         ]
         for future in concurrent.futures.as_completed(futures):
             if future.exception():
@@ -85,25 +377,420 @@ def extractFromZip(zip_path: Path | str, output_path: Path | str, skip_existing:
     logging.info("...done extracting zip.")
 
 
-def _convert_single_csv_to_parquet(
-    csv_file: Path, parquet_path: Path, skip_existing: bool = True
+def _parquet_write_options(sample: Optional[pa.RecordBatch]) -> dict:
+    """Parquet writer options, opting high-cardinality string columns in `sample` out of dictionary encoding."""
+    options = dict(_PARQUET_WRITE_OPTIONS)
+    if sample is None:
+        return options
+    plain_columns = []
+    for name, column in zip(sample.schema.names, sample.columns):
+        if not (pa.types.is_string(column.type) or pa.types.is_large_string(column.type)):
+            continue
+        head = column.slice(0, _DICTIONARY_SAMPLE_SIZE)
+        if len(head) and len(pc.unique(head)) / len(head) > _DICTIONARY_MAX_UNIQUE_RATIO:
+            plain_columns.append(name)
+    if plain_columns:
+        options["use_dictionary"] = [
+            name for name in sample.schema.names if name not in plain_columns]
+        options["column_encoding"] = dict.fromkeys(plain_columns, "PLAIN")
+    return options
+
+
+def _write_batches(writer: pq.ParquetWriter, batches) -> None:
+    """Write record `batches`, coalescing them into row groups of ``_PARQUET_ROW_GROUP_SIZE`` rows."""
+    pending, n_pending = [], 0
+    for batch in batches:
+        pending.append(batch)
+        n_pending += batch.num_rows
+        while n_pending >= _PARQUET_ROW_GROUP_SIZE:
+            # write exactly one full row group, carrying the overflow into the next one.
+            table = pa.Table.from_batches(pending)
+            writer.write_table(
+                table.slice(0, _PARQUET_ROW_GROUP_SIZE), row_group_size=_PARQUET_ROW_GROUP_SIZE)
+            rest = table.slice(_PARQUET_ROW_GROUP_SIZE)
+            pending, n_pending = rest.to_batches(), rest.num_rows
+    if n_pending:
+        writer.write_table(
+            pa.Table.from_batches(pending), row_group_size=_PARQUET_ROW_GROUP_SIZE)
+
+
+@contextlib.contextmanager
+def _removing_on_failure(parquet_file: Path):
+    """Delete `parquet_file` if writing it fails part way."""
+    try:
+        yield
+    except BaseException:
+        # don't leave a truncated file behind for `skip_existing` to trust later.
+        parquet_file.unlink(missing_ok=True)
+        raise
+
+
+#: Where a CSV conversion error reports the offending column, e.g. "In CSV column #3: ...".
+_CSV_ERROR_COLUMN = re.compile(r"In CSV column #(\d+)")
+
+
+def _widened_type(data_type: pa.DataType) -> Optional[pa.DataType]:
+    """The next, looser type to parse a CSV column as when its values don't fit `data_type`, if any."""
+    if pa.types.is_integer(data_type):
+        return pa.float64()
+    if pa.types.is_string(data_type) or pa.types.is_large_string(data_type):
+        return pa.binary()  # invalid UTF-8
+    if pa.types.is_binary(data_type) or pa.types.is_large_binary(data_type):
+        return None
+    return pa.string()
+
+
+class _ColumnTypeError(pa.ArrowInvalid):
+    """A CSV column holds values further down that don't fit the type inferred from the first block."""
+
+    def __init__(self, message: str, schema: pa.Schema):
+        super().__init__(message)
+        #: The file's column types with the offending column widened (see ``_widened_type``).
+        self.schema = schema
+
+
+def _write_csv_stream_to_parquet(
+    source, parquet_file: Path, schema: Optional[pa.Schema] = None,
+    column_names: Optional[list[str]] = None
 ) -> None:
-    """Helper function to convert a single CSV file to a Parquet file."""
+    """Stream CSV `source` (a path or file-like object) into `parquet_file`.
+
+    Record batches are buffered only until they fill a row group, so peak
+    memory stays bounded by ``_PARQUET_ROW_GROUP_SIZE`` rows. The first batch
+    is used to decide which string columns get dictionary-encoded. Columns
+    named in `schema` are parsed as its types, skipping type inference. If
+    `column_names` is given, `source` has no header row.
+
+    Column types are fixed by the first block, so a column whose later values
+    don't fit (e.g. empty, then numbers; or ints, then floats or text) fails
+    the file; this raises ``_ColumnTypeError`` to let the caller reread it
+    with that column widened (see ``_with_schema_fallback``).
+    """
+    with _removing_on_failure(parquet_file), pacsv.open_csv(
+        source,
+        read_options=pacsv.ReadOptions(
+            block_size=_CSV_BLOCK_SIZE, use_threads=True, column_names=column_names),
+        convert_options=pacsv.ConvertOptions(column_types=schema)
+    ) as reader:
+        try:
+            first_batch = next(reader, None)
+            batches = reader if first_batch is None else itertools.chain([first_batch], reader)
+            with pq.ParquetWriter(
+                parquet_file, reader.schema, **_parquet_write_options(first_batch)
+            ) as writer:
+                _write_batches(writer, batches)
+        except pa.ArrowInvalid as exc:
+            match = _CSV_ERROR_COLUMN.match(str(exc))
+            if match is None or int(match[1]) >= len(reader.schema):
+                raise
+            i = int(match[1])
+            widened_type = _widened_type(reader.schema.field(i).type)
+            if widened_type is None:
+                raise
+            raise _ColumnTypeError(
+                str(exc), reader.schema.set(i, reader.schema.field(i).with_type(widened_type))
+            ) from exc
+
+
+def _infer_csv_schema(source, schema: Optional[pa.Schema] = None) -> Optional[pa.Schema]:
+    """Column types inferred from the first block of CSV `source` (parsed as `schema`, where given), or None if it can't be parsed."""
     try:
-        parquet_file = parquet_path.joinpath(csv_file.parent.name, csv_file.stem + ".parquet")
-        if all([skip_existing is True, parquet_file.exists()]):
-            logging.warning("* Skipping existing file: '%s' !", str(parquet_file))
-            return
-        logging.info("Creating new database file: '%s'...", str(parquet_file))
-        df = pd.read_csv(csv_file)
-        df.to_parquet(parquet_file)
-    except KeyboardInterrupt:
-        logging.warning("Conversion interrupted by user.")
-        sys.exit(0)
+        with pacsv.open_csv(
+            source, read_options=pacsv.ReadOptions(block_size=_CSV_BLOCK_SIZE, use_threads=True),
+            convert_options=pacsv.ConvertOptions(column_types=schema)
+        ) as reader:
+            return reader.schema
+    except pa.ArrowInvalid as exc:
+        logging.warning("Could not infer a CSV schema: %s", exc)
+        return None
+
+
+def _with_column_type_fallback(convert, schema: Optional[pa.Schema], name) -> None:
+    """Run ``convert(schema)``, rerunning it with each column that doesn't fit its type widened."""
+    while True:
+        try:
+            return convert(schema)
+        except _ColumnTypeError as exc:
+            logging.warning(
+                "'%s' has values that don't fit the column types of its first block (%s), "
+                "rereading it with looser types.", name, exc)
+            schema = exc.schema
+
+
+def _with_schema_fallback(convert, schema: Optional[pa.Schema], name) -> None:
+    """Run ``convert(schema)``, rerunning it with type inference if the data doesn't fit `schema`."""
+    if schema is not None:
+        try:
+            return _with_column_type_fallback(convert, schema, name)
+        except pa.ArrowInvalid as exc:
+            logging.warning(
+                "'%s' does not match the expected column types (%s), inferring them instead.",
+                name, exc)
+    return _with_column_type_fallback(convert, None, name)
+
+
+def _write_csv_to_parquet_pandas(csv_file: Path, parquet_file: Path) -> None:
+    """Convert `csv_file` by fully materializing it as a pandas DataFrame."""
+    with _removing_on_failure(parquet_file):
+        pd.read_csv(csv_file).to_parquet(
+            parquet_file, engine="pyarrow", row_group_size=_PARQUET_ROW_GROUP_SIZE,
+            **_PARQUET_WRITE_OPTIONS
+        )
+
+
+def _write_csv_to_parquet_cudf(csv_file: Path, parquet_file: Path) -> None:
+    """Convert `csv_file` on the GPU with cuDF, reading it in byte-range chunks."""
+    import cudf
+    from cudf.io.parquet import ParquetWriter
+
+    file_size = csv_file.stat().st_size
+    with _removing_on_failure(parquet_file):
+        writer = ParquetWriter(
+            str(parquet_file), compression="ZSTD", row_group_size_rows=_PARQUET_ROW_GROUP_SIZE)
+        try:
+            # the first chunk carries the header; later chunks reuse its names and dtypes.
+            df = cudf.read_csv(str(csv_file), byte_range=(0, _CUDF_CHUNK_SIZE))
+            names, dtypes = list(df.columns), df.dtypes.to_dict()
+            writer.write_table(df)
+            for offset in range(_CUDF_CHUNK_SIZE, file_size, _CUDF_CHUNK_SIZE):
+                writer.write_table(cudf.read_csv(
+                    str(csv_file), byte_range=(offset, _CUDF_CHUNK_SIZE),
+                    header=None, names=names, dtype=dtypes
+                ))
+        finally:
+            writer.close()
+
+
+#: CSV -> Parquet writers by engine name. ``"cudf"`` requires RAPIDS cuDF and a GPU.
+_CSV_ENGINES = {
+    "arrow": _write_csv_stream_to_parquet,
+    "pandas": _write_csv_to_parquet_pandas,
+    "cudf": _write_csv_to_parquet_cudf,
+}
+
+CsvEngine = Literal["arrow", "pandas", "cudf"]
+
+
+def _parquet_relpath(csv_file: Path) -> str:
+    """Path of the Parquet file for `csv_file`, relative to the Parquet output directory."""
+    return f"{csv_file.parent.name}/{csv_file.stem}.parquet".lstrip("/")
+
+
+def _convert_single_csv_to_parquet(
+    csv_file: Path, parquet_path: Path, existing: AbstractSet[str] = frozenset(),
+    engine: CsvEngine = "arrow", schema: Optional[pa.Schema] = None
+) -> None:
+    """Helper function to convert a single CSV file to a Parquet file.
+
+    `schema` (``"arrow"`` engine only) gives the expected column types; files
+    that don't fit it fall back to type inference.
+    """
+    relpath = _parquet_relpath(csv_file)
+    parquet_file = parquet_path.joinpath(relpath)
+    if relpath in existing:
+        logging.warning("* Skipping existing file: '%s' !", str(parquet_file))
+        return
+    logging.info("Creating new database file: '%s'...", str(parquet_file))
+    if engine == "arrow":
+        _with_schema_fallback(
+            functools.partial(_write_csv_stream_to_parquet, csv_file, parquet_file),
+            schema, csv_file)
+    else:
+        _CSV_ENGINES[engine](csv_file, parquet_file)
+
+
+def _csv_part_range(csv_file: Path, data_start: int, part_start: int, part_end: int) -> tuple[int, int]:
+    """Snap the nominal byte range ``[part_start, part_end)`` of `csv_file` to line boundaries.
+
+    Each boundary moves forward to the start of the next line, so neighbouring
+    parts agree on where one ends and the next begins without coordinating.
+    Quoted values spanning several lines are not supported.
+    """
+    with open(csv_file, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        def line_start(offset: int) -> int:
+            if offset <= data_start:
+                return data_start
+            if offset >= len(mm):
+                return len(mm)
+            newline = mm.find(b"\n", offset - 1)
+            return len(mm) if newline == -1 else newline + 1
+        return line_start(part_start), line_start(part_end)
+
+
+def _convert_csv_part_to_parquet(
+    csv_file: Path, part_file: Path, data_start: int, part_start: int, part_end: int,
+    schema: pa.Schema
+) -> None:
+    """Helper function to convert one byte range ("part") of a large CSV file to a Parquet file."""
+    start, end = _csv_part_range(csv_file, data_start, part_start, part_end)
+    if start >= end:
+        return  # a single line spans the whole part; its neighbour converts it.
+    logging.info("Creating new database file: '%s'...", str(part_file))
+    with pa.memory_map(str(csv_file)) as source:
+        source.seek(start)
+        buffer = source.read_buffer(end - start)
+        _write_csv_stream_to_parquet(
+            pa.BufferReader(buffer), part_file, schema, column_names=schema.names)
+
+
+def _csv_part_schema(inferred: pa.Schema, schema: Optional[pa.Schema] = None) -> pa.Schema:
+    """Column types shared by every part of a split CSV file.
+
+    Types named in `schema` win and the rest come from the head of the file;
+    columns typed ``null`` (empty there) are widened to strings.
+    """
+    fields = []
+    for field in inferred:
+        if schema is not None and field.name in schema.names:
+            field = schema.field(field.name)
+        if pa.types.is_null(field.type):
+            field = field.with_type(pa.string())
+        fields.append(field)
+    return pa.schema(fields)
+
+
+class _SplitCsvFile:
+    """The part conversions of one split CSV file, which succeed or fail together."""
+
+    def __init__(self, csv_file: Path, parts_dir: Path, n_parts: int):
+        self.csv_file = csv_file
+        self.parts_dir = parts_dir
+        self._lock = threading.Lock()
+        self._pending = n_parts
+        self._failed = 0
+
+    def convert_part(self, *args) -> None:
+        """Run ``_convert_csv_part_to_parquet(csv_file, *args)``.
+
+        Once the last part has run, the whole of `parts_dir` is removed if any
+        of them failed, so that a partial dataset is never left behind.
+        """
+        try:
+            _convert_csv_part_to_parquet(self.csv_file, *args)
+            failed = False
+        except Exception as exc:
+            logging.error("Error converting a part of '%s' to Parquet: %s", self.csv_file, exc)
+            failed = True
+        with self._lock:
+            self._pending -= 1
+            self._failed += failed
+            last_failed = self._pending == 0 and self._failed
+        if last_failed:
+            shutil.rmtree(self.parts_dir, ignore_errors=True)
+            raise RuntimeError(
+                f"'{self.csv_file}' failed in {self._failed} part(s), "
+                f"removed its partial output '{self.parts_dir}'")
+
+
+def _csv_part_tasks(
+    csv_file: Path, csv_size: int, parquet_path: Path, existing: AbstractSet[str],
+    schema: Optional[pa.Schema] = None
+) -> Optional[list[functools.partial]]:
+    """Split a large CSV file into ``_CSV_PART_SIZE`` byte ranges, one conversion task each.
+
+    Parts are written to ``<parquet_path>/<parent dir name>/<stem>/part-{i:05d}.parquet``,
+    which ``pyarrow.dataset`` reads back as one dataset. Every part is parsed
+    with one set of column names and types, worked out up front from `schema`
+    and the head of the file (see ``_csv_part_schema``), so that they share a
+    schema. Returns None if the head of the file can't be parsed, in which case
+    it should be converted unsplit.
+
+    A file already converted unsplit (``<stem>.parquet``, e.g. by an earlier
+    run) is skipped, as otherwise a dataset read of the directory would count
+    its rows twice.
+    """
+    relpath = _parquet_relpath(csv_file)
+    if relpath in existing:
+        logging.warning("* Skipping existing file: '%s' !", str(parquet_path.joinpath(relpath)))
+        return []
+    inferred = _infer_csv_schema(csv_file)
+    if inferred is None:
+        return None
+    part_schema = _csv_part_schema(inferred, schema)
+    if schema is not None and _infer_csv_schema(csv_file, part_schema) is None:
+        logging.warning(
+            "'%s' does not match the expected column types, inferring them instead.", csv_file)
+        part_schema = _csv_part_schema(inferred)
+    with open(csv_file, "rb") as f:
+        data_start = len(f.readline())
+    parts_relpath = relpath.removesuffix(".parquet")
+    parts_dir = parquet_path.joinpath(parts_relpath)
+    parts_dir.mkdir(exist_ok=True)
+    parts = []
+    for i in range(math.ceil((csv_size - data_start) / _CSV_PART_SIZE)):
+        relpath = f"{parts_relpath}/part-{i:05d}.parquet"
+        if relpath in existing:
+            logging.warning("* Skipping existing file: '%s' !", str(parquet_path.joinpath(relpath)))
+            continue
+        parts.append((parquet_path.joinpath(relpath), data_start + i * _CSV_PART_SIZE))
+    split = _SplitCsvFile(csv_file, parts_dir, len(parts))
+    return [
+        functools.partial(
+            split.convert_part, part_file, data_start, part_start, part_start + _CSV_PART_SIZE,
+            part_schema)
+        for part_file, part_start in parts
+    ]
+
+
+#: Arrow's global CPU thread pool size, capped by `_conversion_workers`.
+_arrow_cpu_count_patch = _SharedPatch()
+
+
+@contextlib.contextmanager
+def _conversion_workers() -> Iterator[int]:
+    """Cap Arrow's thread pool for the duration of the block, yielding a matching number of per-file conversion workers.
+
+    pyarrow decodes CSV blocks on its own thread pool (without the GIL), so
+    the outer thread pool is sized such that the two don't oversubscribe cores.
+    The pool is process-wide, so its previous size is restored afterwards.
+    """
+    cpu_count = os.cpu_count() or 1
+    arrow_threads = min(_ARROW_THREADS_PER_FILE, cpu_count)
+
+    def apply():
+        previous = pa.cpu_count()
+        pa.set_cpu_count(arrow_threads)
+        return functools.partial(pa.set_cpu_count, previous)
+
+    with _arrow_cpu_count_patch.applied(apply):
+        yield max(1, cpu_count // arrow_threads)
+
+
+def _iter_csv_files(csv_path: Path) -> Iterator[tuple[Path, int]]:
+    """Yield ``(path, size)`` of the CSV files under `csv_path` one directory at a time, largest first within each directory.
+
+    Scheduling large files first keeps a big file submitted last from becoming
+    the straggler that every other worker waits on. Files that can't be
+    stat'ed (e.g. dangling symlinks) are logged and skipped.
+    """
+    for root, _, files in csv_path.walk():
+        csv_files = []
+        for file in files:
+            if not file.endswith(".csv"):
+                continue
+            csv_file = root.joinpath(file)
+            try:
+                csv_files.append((csv_file, csv_file.stat().st_size))
+            except OSError as exc:
+                _log_conversion_error(exc)
+        yield from sorted(csv_files, key=lambda item: item[1], reverse=True)
+
+
+def _log_conversion_error(exc: BaseException) -> None:
+    """Log a CSV -> Parquet conversion error."""
+    logging.error("Error converting a CSV file to Parquet: %s", str(exc))
+
+
+def _log_conversion_errors(futures) -> None:
+    """Log the exceptions raised by finished CSV -> Parquet conversion `futures`."""
+    for future in futures:
+        if future.exception():
+            _log_conversion_error(future.exception())
 
 
 def convertCsvToParquet(
-    csv_path: Path | str, parquet_path: Path | str, skip_existing: bool = True
+    csv_path: Path | str, parquet_path: Path | str, skip_existing: bool = True,
+    engine: CsvEngine = "arrow", schema: Optional[pa.Schema | Literal["auto"]] = None
 ):
     """Convert CSV files to Parquet files.
 
@@ -114,33 +801,197 @@ def convertCsvToParquet(
 
     parquet_path : output path to directory containing .parquet files.
 
+    engine : CSV parser used for the conversion: ``"arrow"`` (streaming pyarrow),
+        ``"pandas"``, or ``"cudf"`` (GPU, requires RAPIDS cuDF).
+
+    schema : column types to parse with, skipping type inference (``"arrow"`` engine only).
+        ``"auto"`` infers them once from the first CSV of each directory and reuses them
+        for its siblings. Files that don't fit fall back to type inference.
+
+    With the ``"arrow"`` engine, CSV files over 1 GiB are split into 256 MiB byte
+    ranges converted in parallel, to ``<parent dir name>/<stem>/part-{i:05d}.parquet``.
+    If any part fails, that file's part directory is removed.
+
     """
+    if engine not in _CSV_ENGINES:
+        raise ValueError(f"Unknown CSV engine '{engine}' (expected one of {list(_CSV_ENGINES)})")
+    if schema is not None and engine != "arrow":
+        raise ValueError(f"A CSV schema can only be used with the 'arrow' engine, not '{engine}'")
+    if engine == "cudf" and importlib.util.find_spec("cudf") is None:
+        logging.warning("CSV engine 'cudf' is not installed, using 'arrow'.")
+        engine = "arrow"
     logging.info("Converting CSVs to Parquet...")
     csv_path = Path(csv_path)
     parquet_path = Path(parquet_path)
     parquet_path.mkdir(parents=False, exist_ok=True)
 
-    # Find all CSV files to convert
-    csv_files = [
-        root.joinpath(file)
-        for root, _, files in csv_path.walk()
-        for file in files
-        if file.endswith(".csv")
-    ]
+    # Find all CSV files to convert, lazily, so conversion starts while the
+    # rest of the tree is still being walked.
+    csv_files = _iter_csv_files(csv_path)
+
+    # one directory scan up front, rather than exists() per file.
+    existing = _existing_files(parquet_path) if skip_existing else frozenset()
+    # column types per output directory (i.e. per group of sibling CSVs).
+    dir_schemas = {}
+
+    with _conversion_workers() as max_workers, concurrent.futures.ThreadPoolExecutor(
+        max_workers=max_workers
+    ) as executor, _cancelling_on_interrupt(executor):
+        in_flight = set()
+        for csv_file, csv_size in csv_files:
+            output_dir = parquet_path.joinpath(_parquet_relpath(csv_file)).parent
+            # an unreadable file only fails itself, not the rest of the walk.
+            try:
+                if output_dir not in dir_schemas:
+                    output_dir.mkdir(exist_ok=True)
+                    dir_schemas[output_dir] = (
+                        _infer_csv_schema(csv_file) if schema == "auto" else schema)
+                tasks = None
+                if engine == "arrow" and csv_size > _LARGE_CSV_SIZE:
+                    # split huge files so they don't become single-threaded stragglers.
+                    tasks = _csv_part_tasks(
+                        csv_file, csv_size, parquet_path, existing, dir_schemas[output_dir])
+            except OSError as exc:
+                _log_conversion_error(exc)
+                continue
+            if tasks is None:
+                tasks = [functools.partial(
+                    _convert_single_csv_to_parquet, csv_file, parquet_path, existing, engine,
+                    dir_schemas[output_dir]
+                )]
+            for task in tasks:
+                # bound the number of queued conversions to keep the walk just ahead of the workers.
+                if len(in_flight) >= 2 * max_workers:
+                    done, in_flight = concurrent.futures.wait(
+                        in_flight, return_when=concurrent.futures.FIRST_COMPLETED)
+                    _log_conversion_errors(done)
+                in_flight.add(executor.submit(task))
+        _log_conversion_errors(concurrent.futures.as_completed(in_flight))
 
-    # Use a process pool to convert files in parallel
-    with concurrent.futures.ProcessPoolExecutor(max_workers=4) as executor:
+
+def convertCsvDatasetToParquet(
+    csv_path: Path | str, parquet_path: Path | str, skip_existing: bool = True
+):
+    """Convert a tree of same-schema CSV files to one Parquet dataset, entirely within Arrow.
+
+    Unlike ``convertCsvToParquet`` there is no per-file output: Arrow's dataset
+    writer reads, encodes and compresses across all the CSVs on its own C++
+    thread pool and writes ``part-{i}.parquet`` files. Every CSV must share the
+    schema of the first one, so use this for homogeneous exports only.
+
+    Arguments:
+    ----------
+
+    csv_path : input path to directory containing CSV files.
+
+    parquet_path : output path to directory containing the Parquet dataset.
+
+    skip_existing : skip the conversion entirely if `parquet_path` already has files
+        (the dataset writer cannot skip individual files).
+
+    """
+    csv_path = Path(csv_path)
+    parquet_path = Path(parquet_path)
+    if skip_existing is True and _existing_files(parquet_path):
+        logging.warning("* Skipping existing dataset: '%s' !", str(parquet_path))
+        return
+    logging.info("Converting CSV dataset to Parquet...")
+    source = pads.dataset(
+        sorted(str(csv_file) for csv_file in csv_path.rglob("*.csv")),
+        format=pads.CsvFileFormat(read_options=pacsv.ReadOptions(block_size=_CSV_BLOCK_SIZE))
+    )
+    pads.write_dataset(
+        source, parquet_path, format="parquet",
+        file_options=pads.ParquetFileFormat().make_write_options(**_PARQUET_WRITE_OPTIONS),
+        # both bounds, or each incoming CSV batch becomes its own row group.
+        min_rows_per_group=_PARQUET_ROW_GROUP_SIZE,
+        max_rows_per_group=_PARQUET_ROW_GROUP_SIZE,
+        use_threads=True,
+        existing_data_behavior="overwrite_or_ignore"
+    )
+
+
+def _convert_single_zipitem_to_parquet(
+    info_item: zipfile.ZipInfo, parquet_path: Path, existing: AbstractSet[str] = frozenset(),
+    schema: Optional[pa.Schema] = None
+) -> None:
+    """Helper function to stream a single CSV member of a zipfile into a Parquet file.
+
+    Reads through the worker thread's own handle (see ``_init_zip_worker``).
+    """
+    _member_output_path(parquet_path, info_item)  # reject unsafe member names
+    relpath = _parquet_relpath(Path(info_item.filename))
+    parquet_file = parquet_path.joinpath(relpath)
+    if relpath in existing:
+        logging.warning("* Skipping existing file: '%s' !", str(parquet_file))
+        return
+    logging.info("Creating new database file: '%s'...", str(parquet_file))
+
+    def convert(schema):
+        with _zip_worker.zipref.open(info_item) as src:
+            _write_csv_stream_to_parquet(pa.input_stream(src), parquet_file, schema)
+
+    _with_schema_fallback(convert, schema, info_item.filename)
+
+
+def convertZipCsvToParquet(
+    zip_path: Path | str, parquet_path: Path | str, skip_existing: bool = True,
+    backend: ZlibBackend = "isal", schema: Optional[pa.Schema | Literal["auto"]] = None
+):
+    """Convert the CSV files inside a zipfile to Parquet files, without extracting them to disk.
+
+    Each CSV member is decompressed straight into the streaming CSV reader, so
+    no intermediate CSV is written (and read back). As in ``convertCsvToParquet``,
+    each member is written to ``<parquet_path>/<parent dir name>/<stem>.parquet``.
+
+    Arguments:
+    ----------
+
+    zip_path : path to the input ZIP file.
+
+    parquet_path : output path to directory containing .parquet files.
+
+    backend : zlib implementation used to inflate deflated members (see ``extractFromZip``).
+
+    schema : column types to parse with, or ``"auto"`` (see ``convertCsvToParquet``).
+
+    """
+    logging.info("Converting zipped CSVs to Parquet...")
+    parquet_path = Path(parquet_path)
+    parquet_path.mkdir(parents=False, exist_ok=True)
+    existing = _existing_files(parquet_path) if skip_existing else frozenset()
+    with zipfile.ZipFile(zip_path, "r") as zipref:
+        # largest first, so the biggest members don't end up as stragglers.
+        csv_members = sorted(
+            (info_item for info_item in zipref.infolist()
+             if not info_item.is_dir() and info_item.filename.endswith(".csv")),
+            key=lambda z: z.file_size,
+            reverse=True
+        )
+        # column types per output directory (i.e. per group of sibling CSVs).
+        dir_schemas, member_schemas = {}, []
+        for info_item in csv_members:
+            output_dir = parquet_path.joinpath(_parquet_relpath(Path(info_item.filename))).parent
+            if output_dir not in dir_schemas:
+                output_dir.mkdir(exist_ok=True)
+                dir_schemas[output_dir] = schema
+                if schema == "auto":
+                    with zipref.open(info_item) as src:
+                        dir_schemas[output_dir] = _infer_csv_schema(pa.input_stream(src))
+            member_schemas.append((info_item, dir_schemas[output_dir]))
+    with _zip_decompression_backend(backend), _conversion_workers() as max_workers, \
+            _zip_worker_pool(zip_path, max_workers) as executor, _cancelling_on_interrupt(executor):
         futures = [
             executor.submit(
-                _convert_single_csv_to_parquet, csv_file, parquet_path,
-                skip_existing=skip_existing
+                _convert_single_zipitem_to_parquet, info_item, parquet_path, existing,
+                member_schema
             )
-            for csv_file in csv_files
+            for info_item, member_schema in member_schemas
         ]
         for future in concurrent.futures.as_completed(futures):
             if future.exception():
                 logging.error(
-                    "Error converting a CSV file to Parquet: %s",
+                    "Error converting a zipped CSV file to Parquet: %s",
                     str(future.exception())
                 )
 
@@ -148,13 +999,18 @@ def convertCsvToParquet(
 class Csv2ParquetPipeline:
     def __init__(
         self, zip_path: str | Path, csv_path: str | Path, parquet_path: str | Path,
-        skip_existing: bool = True
+        skip_existing: bool = True, engine: CsvEngine = "arrow",
+        schema: Optional[pa.Schema | Literal["auto"]] = None
     ):
         self.zip_path = zip_path
         self.csv_path = csv_path
         self.parquet_path = parquet_path
         #: Flag to indicate if existing files should be skipped (rather than overwritten)
         self.skip_existing = skip_existing
+        #: CSV parser used for CSV -> Parquet conversion ("arrow", "pandas" or "cudf")
+        self.engine = engine
+        #: Column types for the CSVs ("auto" to infer them once per directory), see `convertCsvToParquet`
+        self.schema = schema
 
     def __call__(self, parquet_path: Optional[str | Path] = None):
         """Execute the csv2parquet pipeline in order."""
@@ -170,19 +1026,94 @@ class Csv2ParquetPipeline:
 
         return self
 
+    def pipeline_stream(self, parquet_path: Optional[str | Path] = None):
+        """Execute the csv2parquet pipeline as a single pass (ZIP -> Parquet), skipping the CSVs on disk.
+
+        Only the ``"arrow"`` engine can read CSVs straight out of the zipfile.
+        """
+
+        if self.engine != "arrow":
+            raise ValueError(
+                f"The streaming pipeline only supports the 'arrow' engine, not '{self.engine}'")
+        if parquet_path is not None:
+            self.parquet_path = parquet_path
+
+        convertZipCsvToParquet(
+            self.zip_path, self.parquet_path, skip_existing=self.skip_existing, schema=self.schema)
+
+        return self
+
     def extract_csvs_from_zip(self):
         return extractFromZip(self.zip_path, self.csv_path, skip_existing=self.skip_existing)
 
     def convert_csvs_to_parquet(self):
-        return convertCsvToParquet(self.csv_path, self.parquet_path, skip_existing=self.skip_existing)
+        return convertCsvToParquet(
+            self.csv_path, self.parquet_path, skip_existing=self.skip_existing, engine=self.engine,
+            schema=self.schema)
 
 
-def unzipCsv2Parquet(zip_path, csv_path, parquet_path, skip_existing=True):
+def unzipCsv2Parquet(zip_path, csv_path, parquet_path, skip_existing=True, engine="arrow"):
     pipeline = Csv2ParquetPipeline(
-        zip_path, csv_path, parquet_path, skip_existing=skip_existing)
+        zip_path, csv_path, parquet_path, skip_existing=skip_existing, engine=engine)
     pipeline()
 
 
+def configure_logging(log_dir: Path | str = "logs") -> logging.handlers.QueueListener:
+    """Log to stderr and to a UTC-timestamped file in `log_dir`.
+
+    The file name carries the start time (to the second) and the process id,
+    so runs launched within the same second don't interleave in one file.
+
+    Records are handed to a ``QueueHandler`` and written by a background
+    ``QueueListener``, so worker threads never block on (or contend for) the
+    log file. Returns the started listener; stop it before exiting to flush.
+    """
+    log_dir = Path(log_dir)
+    log_dir.mkdir(exist_ok=True)
+    tstamp = time.strftime('%Y-%m-%d-%H_%M_%S', time.gmtime())
+    log_filename = log_dir / f"{tstamp}-{os.getpid()}.log"
+
+    logging.config.dictConfig(
+        {
+            "version": 1,
+            "formatters": {
+                "standard": {"format": "%(asctime)s [%(levelname)s] %(name)s: %(message)s"}
+            },
+            "handlers": {
+                "default": {
+                    "level": "INFO",
+                    "class": "logging.StreamHandler",
+                    "formatter": "standard",
+                },
+                "file": {
+                    "level": "INFO",
+                    "class": "logging.handlers.WatchedFileHandler",
+                    "formatter": "standard",
+                    "filename": str(log_filename),
+                    "mode": "a",
+                    "encoding": "utf-8",
+                    "delay": True,
+                },
+                "queue": {
+                    "class": "logging.handlers.QueueHandler",
+                    "handlers": ["default", "file"],
+                    "respect_handler_level": True,
+                },
+            },
+            "loggers": {
+                "": {
+                    "handlers": ["queue"],
+                    "level": "INFO",
+                    "propagate": True
+                }
+            },
+        }
+    )
+    listener = logging.getHandlerByName("queue").listener
+    listener.start()
+    return listener
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Extract CSVs from a ZIP file and convert them to Parquet format."
@@ -213,16 +1144,30 @@ def main():
         dest="skip_existing",
         help="Set --skip-existing flag to False.",
     )
+    parser.add_argument(
+        "--engine",
+        required=False,
+        choices=list(_CSV_ENGINES),
+        default="arrow",
+        help="CSV parser used for the Parquet conversion ('cudf' requires a GPU).",
+    )
 
     parsed_args = parser.parse_args()
     parsed_args_fmt = json.dumps(vars(parsed_args), indent=3)
     input(
         f"\n=== Press any key to confirm (\033[91mor CTRL+C to exit early\033[0m). ====\n\n{parsed_args_fmt}"
     )
-    unzipCsv2Parquet(
-        parsed_args.zip_path, parsed_args.csv_path, parsed_args.parquet_path,
-        skip_existing=parsed_args.skip_existing
-    )
+    listener = configure_logging()
+    try:
+        unzipCsv2Parquet(
+            parsed_args.zip_path, parsed_args.csv_path, parsed_args.parquet_path,
+            skip_existing=parsed_args.skip_existing, engine=parsed_args.engine
+        )
+    except KeyboardInterrupt:
+        logging.warning("Interrupted by user.")
+        sys.exit(0)
+    finally:
+        listener.stop()
 
 
 if __name__ == "__main__":